@@ -1,4 +1,4 @@
-from threading import Thread, Lock
+from threading import Event, Lock
 import time
 
 import numpy as np
@@ -109,15 +109,19 @@ class ArduinoDAQ(_BaseDAQ):
 
         self._resetboard()
 
-        self.board.samplingOn(1000 / self.rate)
-        self.board.analog[0].register_callback(self._callback)
-        for pin in self.pins_:
-            self.board.analog[pin].enable_reporting()
+        # Bound read methods of the selected pins, looked up once.
+        self._pin_readers = [self.board.analog[pin].read for pin in self.pins_]
         self._lock = Lock()
         self._sample = 0
-        self._buffer = np.zeros((len(self.pins_), self.samples_per_read))
-        self._data = np.zeros((len(self.pins_), self.samples_per_read))
-        self._data_ready = False
+        # Two buffers are used in turn: the callback fills one while the
+        # other holds the data returned by read().
+        self._buffers = [
+            np.empty((len(self.pins_), self.samples_per_read),
+                     dtype=np.float32)
+            for _ in range(2)]
+        self._write_idx = 0
+        self._data = self._buffers[1]
+        self._data_ready = Event()
 
         self._debug_print = DebugPrinter()
 
@@ -139,37 +143,26 @@ class ArduinoDAQ(_BaseDAQ):
     def start(self):
         if not self.board.sp.is_open:
             self.board.sp.open()
+        # USB serial adapters buffer incoming bytes for up to 16 ms by default,
+        # which delays every sample. Not supported on all platforms.
+        try:
+            self.board.sp.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass
 
-        self._flag = True
+        # Discard any partly filled or unread buffer from before a stop().
+        self._sample = 0
+        self._write_idx = 0
+        self._data_ready.clear()
 
-        self._thread = Thread(target=self._run, daemon=True)
-        self._thread.start()
-
-    def _run(self):
-        while self._flag:
-            try:
-                # Introduces bug when using pyfirmata2 callback method
-                # while self.board.bytes_available():
-                #    self.board.iterate()
-
-                # 6 analog inputs X 10 bits/input
-                time.sleep(1/(self.baudrate/60))
-            except (AttributeError, TypeError, SerialException, OSError):
-                # this way we can kill the thread by setting the board object
-                # to None, or when the serial port is closed by board.exit()
-                break
-            except Exception as e:
-                # catch 'error: Bad file descriptor'
-                # iterate may be called while the serial port is being closed,
-                # causing an "error: (9, 'Bad file descriptor')"
-                if getattr(e, "errno", None) == 9:
-                    break
-                try:
-                    if e[0] == 9:
-                        break
-                except (IndexError):
-                    pass
-                raise
+        # Samples are delivered to the callback by pyfirmata2's own reader
+        # thread, so there is no need for a thread of our own.
+        self.board.samplingOn(1000 / self.rate)
+        self.board.analog[0].register_callback(self._callback)
+        for pin in self.pins_:
+            self.board.analog[pin].enable_reporting()
+
+        self._flag = True
 
     def _resetboard(self):
         """
@@ -187,10 +180,10 @@ class ArduinoDAQ(_BaseDAQ):
         # Callback and sampling off
         self.board.analog[0].unregiser_callback()
         self.board.samplingOff()
-        # Flush remaining data
+        # Discard remaining data. Nothing is listening for these messages any
+        # more, so there is no need to read or parse them.
         try:
-            while self.board.bytes_available():
-                self.board.iterate()
+            self.board.sp.reset_input_buffer()
         except (SerialException):
             pass
 
@@ -204,26 +197,25 @@ class ArduinoDAQ(_BaseDAQ):
         """
         Request a sample of data from the device.
 
-        This method blocks (calls ``time.sleep()``) to emulate other data
-        acquisition units which wait for the requested number of samples to be
-        read. The amount of time to block is dependent on rate and on the
-        samples_per_read. Calls will return with relatively constant frequency,
-        assuming calls occur faster than required (i.e. processing doesn't fall behind).
+        This method blocks until the callback signals that a full buffer is
+        available, to emulate other data acquisition units which wait for the
+        requested number of samples to be read. The amount of time to block is
+        dependent on rate and on the samples_per_read. Calls will return with
+        relatively constant frequency, assuming calls occur faster than
+        required (i.e. processing doesn't fall behind).
 
         Returns
         -------
         data : ndarray, shape=(n_pins, samples_per_read)
             Data read from the device. Each pin is a row and each column
-            is a point in time.
+            is a point in time. The array is reused by the device and will be
+            overwritten once the next buffer has been filled.
         """
         if self._flag:
-            while (not self._data_ready):
-                # cannot time smaller than 10 - 15 ms in Windows
-                # this delays copying a chunk, not reading samples
-                time.sleep(0.01)
+            self._data_ready.wait()
             with self._lock:
                 data = self._data
-                self._data_ready = False
+                self._data_ready.clear()
             #     s = self._sample
             # self._debug_print.print(s)
             return data
@@ -236,17 +228,23 @@ class ArduinoDAQ(_BaseDAQ):
         Pyfirmata2 triggered callback.
 
         This callback is triggered by the Arduino. Data is read from the pins
-        and copied to a buffer. Once the buffer is full is is copied to a read
-        buffer. The samples_per_read relative to rate must allow sufficient
-        time for the read buffer self._data to be output by the read() function.
+        and copied to a buffer. Once the buffer is full it is published as the
+        read buffer self._data and the callback switches to the other buffer.
+        The samples_per_read relative to rate must allow sufficient time for
+        self._data to be output by the read() function.
         """
-        with self._lock:
-            for j, pin in enumerate(self.pins_):
-                _s = self.board.analog[pin].read()
-                if _s:
-                    self._buffer[j, self._sample] = _s
-            self._sample += 1
-            if (self._sample >= self.samples_per_read):
-                self._data = self._buffer
-                self._data_ready = True
-                self._sample = 0
+        # Read each pin once and store the whole column in one go, rather
+        # than one Python-level store per pin. Pins return None until their
+        # first value has been received.
+        vals = np.fromiter(
+            (read() or 0.0 for read in self._pin_readers),
+            dtype=np.float32, count=len(self.pins_))
+        buffer = self._buffers[self._write_idx]
+        buffer[:, self._sample] = vals
+        self._sample += 1
+        if (self._sample >= self.samples_per_read):
+            self._sample = 0
+            with self._lock:
+                self._data = buffer
+                self._write_idx ^= 1
+                self._data_ready.set()
@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from threading import Condition
+
+import numpy as np
+
 
 class _BaseDAQ(ABC):
     """
@@ -25,3 +29,155 @@ class _BaseDAQ(ABC):
             self.stop()
         except BaseException:
             pass
+
+
+class _RingBuffer(object):
+    """
+    Ring buffer of multi-channel samples, shared by a producer and a consumer.
+
+    Samples are written and read in chunks. Each chunk costs a single lock
+    acquisition and at most two slice copies, however many samples it holds.
+    The buffer is reallocated only when a write would overflow it, unless it
+    is set to overwrite its oldest samples instead.
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of channels, i.e. rows of the buffer.
+    capacity : int
+        Initial number of samples per channel the buffer can hold.
+    dtype : data-type
+        Data type of the samples.
+    overwrite : bool, optional
+        If ``True``, the capacity is fixed and writes that would overflow the
+        buffer discard its oldest samples instead. Default is ``False``.
+    """
+
+    def __init__(self, n_channels, capacity, dtype, overwrite=False):
+        self._buffer = np.empty((n_channels, capacity), dtype=dtype)
+        self._overwrite = overwrite
+        self._read_idx = 0
+        self._count = 0
+        self._closed = False
+        self._cond = Condition()
+
+    def __len__(self):
+        return self._count
+
+    def write(self, data):
+        """
+        Append samples to the buffer and wake up a blocked reader.
+
+        Parameters
+        ----------
+        data : ndarray or sequence of 1-D arrays
+            Samples to append, with one row per channel. A sequence of
+            equal-length 1-D arrays is copied row by row, so it does not need
+            to be stacked first. A 1-D array is treated as a single sample.
+        """
+        if isinstance(data, np.ndarray) and data.ndim == 1:
+            data = data[:, np.newaxis]
+        n_samples = len(data[0])
+        with self._cond:
+            capacity = self._buffer.shape[1]
+            if self._overwrite:
+                if n_samples > capacity:
+                    if isinstance(data, np.ndarray):
+                        data = data[:, -capacity:]
+                    else:
+                        data = [samples[-capacity:] for samples in data]
+                    n_samples = capacity
+                n_dropped = self._count + n_samples - capacity
+                if n_dropped > 0:
+                    self._read_idx = (self._read_idx + n_dropped) % capacity
+                    self._count -= n_dropped
+            elif self._count + n_samples > capacity:
+                self._grow(self._count + n_samples)
+                capacity = self._buffer.shape[1]
+
+            write_idx = (self._read_idx + self._count) % capacity
+            n_first = min(n_samples, capacity - write_idx)
+            if isinstance(data, np.ndarray):
+                self._buffer[:, write_idx:write_idx + n_first] = \
+                    data[:, :n_first]
+                self._buffer[:, :n_samples - n_first] = data[:, n_first:]
+            else:
+                for buffer_row, samples in zip(self._buffer, data):
+                    buffer_row[write_idx:write_idx + n_first] = \
+                        samples[:n_first]
+                    buffer_row[:n_samples - n_first] = samples[n_first:]
+            self._count += n_samples
+            self._cond.notify()
+
+    def read(self, n_samples, timeout=None, copy=True, out=None):
+        """
+        Remove and return the oldest ``n_samples`` samples.
+
+        Blocks until enough samples are available, or the buffer is closed.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of samples per channel to read.
+        timeout : float, optional
+            Maximum time to wait for, in seconds. Default is None, which
+            waits forever.
+        copy : bool, optional
+            If ``False``, a view of the buffer is returned whenever the
+            samples do not wrap around its end. The view is only valid until
+            the next write. Default is ``True``.
+        out : ndarray, optional
+            Array of shape (n_channels, n_samples) to copy the samples into,
+            instead of allocating a new one.
+
+        Returns
+        -------
+        data : ndarray, shape=(n_channels, n_samples)
+            Samples read, or ``None`` if the timeout expired or the buffer
+            was closed before enough samples were available.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._count >= n_samples or self._closed, timeout)
+            if self._count < n_samples:
+                return None
+            end = self._read_idx + n_samples
+            if not copy and end <= self._buffer.shape[1]:
+                data = self._buffer[:, self._read_idx:end]
+            else:
+                data = self._copy_out(n_samples, out)
+            self._read_idx = end % self._buffer.shape[1]
+            self._count -= n_samples
+
+        return data
+
+    def clear(self):
+        """Discard all unread samples."""
+        with self._cond:
+            self._read_idx = 0
+            self._count = 0
+
+    def close(self):
+        """Wake up blocked readers and stop waiting for more samples."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _copy_out(self, n_samples, out=None):
+        capacity = self._buffer.shape[1]
+        n_first = min(n_samples, capacity - self._read_idx)
+        if out is None:
+            out = np.empty((self._buffer.shape[0], n_samples),
+                           dtype=self._buffer.dtype)
+        out[:, :n_first] = \
+            self._buffer[:, self._read_idx:self._read_idx + n_first]
+        out[:, n_first:] = self._buffer[:, :n_samples - n_first]
+        return out
+
+    def _grow(self, min_capacity):
+        capacity = max(2 * self._buffer.shape[1], min_capacity)
+        buffer = np.empty((self._buffer.shape[0], capacity),
+                          dtype=self._buffer.dtype)
+        buffer[:, :self._count] = self._copy_out(self._count)
+        self._buffer = buffer
+        self._read_idx = 0
@@ -3,7 +3,7 @@ import time
 import numpy as np
 from cerebus import cbpy
 
-from .base import _BaseDAQ
+from .base import _BaseDAQ, _RingBuffer
 
 __all__ = ['Blackrock']
 
@@ -40,6 +40,8 @@ class Blackrock(_BaseDAQ):
         self._initialize()
 
     def _initialize(self):
+        self._channel_rows = {
+            channel: row for row, channel in enumerate(self.channels)}
         result, return_dict = cbpy.open(
             connection='default',
             parameter=cbpy.defaultConParams())
@@ -53,24 +55,41 @@ class Blackrock(_BaseDAQ):
 
         You should call ``read()`` soon after this.
         """
+        # Raw samples are 16-bit integers, so there is no need to have them
+        # converted to double precision.
         buffer_parameter = {
-            'double': True
+            'double': False
         }
         result, _ = cbpy.trial_config(
             reset=True,
             buffer_parameter=buffer_parameter)
         err_msg = "Trial configuration was not set successfully."
         self._check_result(result, RuntimeError, err_msg)
-        self.cache_ = np.zeros((len(self.channels), 0))
+        # Samples fetched from the NSP but not yet returned by ``read()``.
+        self._ring = _RingBuffer(len(self.channels), 4 * self.samples_per_read,
+                                 dtype=np.int16)
 
     def _read_nsp(self):
         result, trial = cbpy.trial_continuous(reset=True)
-        data = []
+        if len(trial) == 0:
+            return None
+
+        # One row per requested channel, in the order of ``self.channels``
+        # rather than the order channels are reported by the NSP.
+        data = [None] * len(self.channels)
         for channel_number, channel_data in trial:
-            if channel_number in self.channels:
-                data.append(channel_data)
+            row = self._channel_rows.get(channel_number)
+            if row is not None:
+                data[row] = channel_data
+
+        missing = [channel for channel, row in zip(self.channels, data)
+                   if row is None]
+        if missing:
+            raise ValueError(
+                "Channels {} were not reported by the NSP. Check that they "
+                "are enabled in Central.".format(missing))
 
-        return np.array(data)
+        return data
 
     def read(self):
         """
@@ -81,29 +100,29 @@ class Blackrock(_BaseDAQ):
 
         Returns
         -------
-        data : ndarray, shape=(total_signals, num_samples)
+        data : ndarray of float32, shape=(total_signals, num_samples)
             Data read from the device. Each channel is a row and each column
             is a point in time.
         """
-        cur_data = np.copy(self.cache_)
-        while cur_data.shape[1] < self.samples_per_read:
+        while len(self._ring) < self.samples_per_read:
+            # Channel arrays are copied straight into the ring buffer, once
+            # per poll, without being stacked into an intermediate array.
             new_data = self._read_nsp()
-            if len(new_data) > 0:
-                cur_data = np.append(cur_data, new_data, axis=1)
+            if new_data is not None and len(new_data[0]) > 0:
+                self._ring.write(new_data)
 
             # It seems that NSP/Central can not handle continuous polling
             # therefore a tiny sleep is required between two consecutive
             # polling operations to ensure that data acquisition is not hanged.
             time.sleep(1e-9)
 
-        if cur_data.shape[1] > self.samples_per_read:
-            data = cur_data[:, :self.samples_per_read]
-            self.cache_ = cur_data[:, self.samples_per_read:]
-        else:
-            data = cur_data
-            self.cache_ = np.zeros((len(self.channels), 0))
-
-        return data
+        # Samples are buffered as int16, but returned as floats so that
+        # squaring or taking the absolute value does not overflow. They are
+        # cast while being copied out of the ring, into a new array so that
+        # it is not overwritten by the next read.
+        data = np.empty((len(self.channels), self.samples_per_read),
+                        dtype=np.float32)
+        return self._ring.read(self.samples_per_read, out=data)
 
     def stop(self):
         """Tell the device to stop streaming data."""
@@ -1,11 +1,10 @@
-import queue
-from threading import Lock, Thread
+from threading import Thread
 import time
 
 import myo
 import numpy as np
 
-from .base import _BaseDAQ
+from .base import _BaseDAQ, _RingBuffer
 
 __all__ = ['MyoEMG', 'MyoIMU']
 
@@ -20,9 +19,7 @@ class _Myo(myo.DeviceListener, _BaseDAQ):
 
     def __init__(self):
         super().__init__()
-        self.data_queue = queue.Queue()
         self._hub = myo.Hub()
-        self._lock = Lock()
 
     def start(self):
         self._thread = Thread(target=self._run)
@@ -42,7 +39,8 @@ class _Myo(myo.DeviceListener, _BaseDAQ):
         raise NotImplementedError
 
     def reset(self):
-        self.data_queue.queue.clear()
+        """Discard buffered samples."""
+        self._ring.clear()
 
 
 class MyoEMG(_Myo):
@@ -61,11 +59,6 @@ class MyoEMG(_Myo):
     zero_based : bool, optional
         If ``True``, 0-based indexing is used for channel numbering. Default is
         ``False``.
-
-    Attributes
-    ----------
-    data_queue : Queue
-        Fifo Queue to store incoming data.
     """
 
     def __init__(self, channels, samples_per_read, zero_based=False):
@@ -74,6 +67,8 @@ class MyoEMG(_Myo):
         self.samples_per_read = samples_per_read
         self.zero_based = zero_based
 
+        # The armband always streams all 8 EMG channels.
+        self._ring = _RingBuffer(8, 4 * samples_per_read, dtype=np.int8)
         self._make_indices()
 
     def _make_indices(self):
@@ -88,9 +83,8 @@ class MyoEMG(_Myo):
         event.device.stream_emg(True)
 
     def on_emg(self, event):
-        """Updates data queue when an EMG event happens."""
-        with self._lock:
-            self.data_queue.put(event.emg)
+        """Updates data buffer when an EMG event happens."""
+        self._ring.write(np.asarray(event.emg, dtype=np.int8))
 
     def read(self):
         """
@@ -101,19 +95,14 @@ class MyoEMG(_Myo):
 
         Returns
         -------
-        data : ndarray, shape=(num_channels, num_samples)
+        data : ndarray of float32, shape=(num_channels, num_samples)
             Data read from the device. Each channel is a row and each column
             is a point in time.
         """
-        data = []
-        while len(data) < self.samples_per_read:
-            try:
-                data.append(self.data_queue.get())
-            except IndexError:
-                pass
-
-        data = np.atleast_2d(np.asarray(data)).T
-        return data[self._channel_indices, :]
+        data = self._ring.read(self.samples_per_read)
+        # Samples are buffered as int8, but returned as floats so that
+        # squaring or taking the absolute value does not overflow.
+        return data[self._channel_indices, :].astype(np.float32)
 
 
 class MyoIMU(_Myo):
@@ -126,25 +115,23 @@ class MyoIMU(_Myo):
     ----------
     samples_per_read : int
         Number of samples per channel to read in each read operation.
-
-    Attributes
-    ----------
-    data_queue : Queue
-        Fifo Queue to store incoming data.
     """
 
     def __init__(self, samples_per_read):
         super(MyoIMU, self).__init__()
         self.samples_per_read = samples_per_read
 
+        # Orientation quaternions have 4 components.
+        self._ring = _RingBuffer(4, 4 * samples_per_read, dtype=np.float32)
+
     def on_connected(self, event):
         """Enables RSII streaming."""
         event.device.request_rssi()
 
     def on_orientation(self, event):
-        """Updates data queue when an orientation event happens."""
-        with self._lock:
-            self.data_queue.put(event.orientation)
+        """Updates data buffer when an orientation event happens."""
+        self._ring.write(
+            np.fromiter(event.orientation, dtype=np.float32, count=4))
 
     def read(self):
         """
@@ -159,12 +146,4 @@ class MyoIMU(_Myo):
             Data read from the device. Each channel is a row and each column
             is a point in time.
         """
-        data = []
-        while len(data) < self.samples_per_read:
-            try:
-                data.append(np.array(list(self.data_queue.get())))
-            except IndexError:
-                pass
-
-        data = np.atleast_2d(data).T
-        return data
+        return self._ring.read(self.samples_per_read)
@@ -1,5 +1,6 @@
 import numpy as np
 from nidaqmx.constants import AcquisitionType
+from nidaqmx.stream_readers import AnalogMultiChannelReader
 from nidaqmx.task import Task
 
 from .base import _BaseDAQ
@@ -34,26 +35,32 @@ class Nidaq(_BaseDAQ):
         self.dev = dev
         self.zero_based = zero_based
 
-        self._initialize()
+        self._task = None
 
     def _initialize(self):
+        # Release any task created by a previous start() or reset().
+        self._close_task()
         self._task = Task()
 
+        prefix = 'Dev{}/ai'.format(self.dev)
         for channel in self.channels:
             if self.zero_based:
                 channel_no = channel
             else:
                 channel_no = channel - 1
-            chan_name = 'Dev' + self.dev + '/ai' + str(channel_no)
+            chan_name = prefix + str(channel_no)
             self._task.ai_channels.add_ai_voltage_chan(chan_name)
 
         self._task.timing.cfg_samp_clk_timing(
             rate=self.rate,
             sample_mode=AcquisitionType.FINITE)
 
+        # Samples are read by DAQmx directly into a numpy array.
+        self._reader = AnalogMultiChannelReader(self._task.in_stream)
+
     def start(self):
-        """Tell the device to begin streaming data. Does not do anything."""
-        pass
+        """Tell the device to begin streaming data."""
+        self._initialize()
 
     def read(self):
         """
@@ -68,13 +75,22 @@ class Nidaq(_BaseDAQ):
             Data read from the device. Each channel is a row and each column
             is a point in time.
         """
-        data = self._task.read(
-            number_of_samples_per_channel=self.samples_per_read)
-        return np.array(data)
+        # A new array on each read, so that results handed over to another
+        # thread are not overwritten by the next read.
+        data = np.empty((len(self.channels), self.samples_per_read),
+                        dtype=np.float64)
+        self._reader.read_many_sample(
+            data, number_of_samples_per_channel=self.samples_per_read)
+        return data
 
     def stop(self):
         """Tell the device to stop streaming data."""
-        self._task.close()
+        self._close_task()
+
+    def _close_task(self):
+        if self._task is not None:
+            self._task.close()
+            self._task = None
 
     def reset(self):
         """Reset the task."""
@@ -1,5 +1,9 @@
+import ctypes
+import errno
+import os
+import select
 import socket
-import struct
+import sys
 
 import numpy as np
 
@@ -8,6 +12,102 @@ from .base import _BaseDAQ
 __all__ = ['TCPSocketReader', 'UDPSocketReader']
 
 
+# recvmmsg(2) receives several datagrams with one system call. It is only
+# available on Linux, where it is looked up in the C library at import time.
+class _iovec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_iovec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _msghdr),
+                ('msg_len', ctypes.c_uint)]
+
+
+_MSG_TRUNC = 0x20
+_MSG_WAITFORONE = 0x10000
+
+_recvmmsg = None
+if sys.platform.startswith('linux'):
+    _recvmmsg = getattr(ctypes.CDLL(None, use_errno=True), 'recvmmsg', None)
+    if _recvmmsg is not None:
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint,
+                              ctypes.c_int, ctypes.c_void_p]
+        _recvmmsg.restype = ctypes.c_int
+
+
+class _DatagramReceiver(object):
+    """
+    Receives the datagrams making up a buffer with recvmmsg(2).
+
+    Each datagram is written to its own ``datagram_size`` slot of
+    ``buffer``, so all datagrams must have exactly that size.
+    """
+
+    def __init__(self, buffer, datagram_size):
+        self.n_datagrams = len(buffer) // datagram_size
+        self.datagram_size = datagram_size
+
+        self._c_buffer = (ctypes.c_char * len(buffer)).from_buffer(buffer)
+        address = ctypes.addressof(self._c_buffer)
+        self._iovecs = (_iovec * self.n_datagrams)()
+        self._msgs = (_mmsghdr * self.n_datagrams)()
+        for i in range(self.n_datagrams):
+            self._iovecs[i].iov_base = address + i * datagram_size
+            self._iovecs[i].iov_len = datagram_size
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+        self._msgs_address = ctypes.addressof(self._msgs)
+
+    def receive(self, sock):
+        """Fill the buffer, honouring the socket timeout between datagrams."""
+        fd = sock.fileno()
+        timeout = sock.gettimeout()
+        n_received = 0
+        while n_received < self.n_datagrams:
+            if timeout is not None:
+                ready, _, _ = select.select([fd], [], [], timeout)
+                if not ready:
+                    raise socket.timeout()
+
+            # Blocks for the first datagram only, then takes whatever else is
+            # already queued.
+            n_msgs = _recvmmsg(
+                fd,
+                self._msgs_address + n_received * ctypes.sizeof(_mmsghdr),
+                self.n_datagrams - n_received,
+                _MSG_WAITFORONE,
+                None)
+            if n_msgs < 0:
+                err = ctypes.get_errno()
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                    continue
+                raise OSError(err, os.strerror(err))
+
+            for msg in self._msgs[n_received:n_received + n_msgs]:
+                # Larger datagrams are truncated to the slot size by the
+                # kernel, which only reports it through MSG_TRUNC.
+                if msg.msg_hdr.msg_flags & _MSG_TRUNC:
+                    raise IOError(
+                        "Expected datagrams of {} bytes, but received a "
+                        "larger one.".format(self.datagram_size))
+                if msg.msg_len != self.datagram_size:
+                    raise IOError(
+                        "Expected datagrams of {} bytes, but received one of "
+                        "{} bytes.".format(self.datagram_size, msg.msg_len))
+            n_received += n_msgs
+
+
 class _SocketReader(_BaseDAQ):
     """
     Base class for Socket reader devices
@@ -23,31 +123,51 @@ class _SocketReader(_BaseDAQ):
             array_len,
             samples_per_read,
             precision,
-            timeout):
+            timeout,
+            layout):
         self.ip = ip
         self.port = port
         self.array_len = array_len
         self.samples_per_read = samples_per_read
         self.precision = precision
         self.timeout = timeout
+        self.layout = layout
 
         self._init()
 
     def _init(self):
         if self.precision == 'single':
-            self._format = 'f'
-            self._bytes_per_float = 4
+            self._dtype = np.dtype('<f4')
         elif self.precision == 'double':
-            self._format = 'd'
-            self._bytes_per_float = 8
+            self._dtype = np.dtype('<f8')
         else:
             raise ValueError(
                 "Precision must be either ``single`` or ``double``, but "
                 "``{}`` was provided.".format(self.precision))
+        if self.layout not in ('channel_major', 'view'):
+            raise ValueError(
+                "Layout must be either ``channel_major`` or ``view``, but "
+                "``{}`` was provided.".format(self.layout))
+
+        self._count = self.array_len * self.samples_per_read
+        self._lenmsg = self._count * self._dtype.itemsize
+        # Packets are received straight into a buffer allocated once.
+        self._buffer = bytearray(self._lenmsg)
+        self._view = memoryview(self._buffer)
+        # Channel-major view of the receive buffer, created once since the
+        # buffer never moves and the shape is fixed. The wire layout is
+        # sample-major, so this view is strided.
+        self._packet = np.frombuffer(
+            self._buffer, dtype=self._dtype, count=self._count).reshape(
+                (self.samples_per_read, self.array_len)).T
 
-        self._fmt = '<' + self._format * self.array_len * self.samples_per_read
-        self._lenmsg = self.samples_per_read * self.array_len * \
-            self._bytes_per_float
+    def _unpack(self):
+        """Return the received packet in the requested layout."""
+        if self.layout == 'view':
+            return self._packet
+        # A new array on each read, so that results handed over to another
+        # thread are not overwritten by the next packet.
+        return np.array(self._packet, order='C')
 
     def stop(self):
         self.socket.close()
@@ -71,6 +191,16 @@ class TCPSocketReader(_SocketReader):
         Floating point precision. Default is 'single'.
     timeout : float, optional
         Socket timeout time. Default is None.
+    layout : str {'channel_major', 'view'}
+        Memory layout of the data returned by ``read()``. ``'channel_major'``
+        copies it into a new C-contiguous array. ``'view'`` returns a strided
+        view of the receive buffer without copying, which is cheaper when the
+        data are only reduced per channel (e.g. mean or RMS), but is
+        overwritten by the next call to ``read()``. Default is
+        'channel_major'.
+    rcvbuf : int, optional
+        Size of the kernel receive buffer, in bytes. Default is None, which
+        uses the larger of 4 MiB and 8 reads' worth of data.
     """
     def __init__(
             self,
@@ -79,19 +209,38 @@ class TCPSocketReader(_SocketReader):
             array_len,
             samples_per_read,
             precision='single',
-            timeout=None):
+            timeout=None,
+            layout='channel_major',
+            rcvbuf=None):
         super(TCPSocketReader, self).__init__(
             ip=ip,
             port=port,
             array_len=array_len,
             samples_per_read=samples_per_read,
             precision=precision,
-            timeout=timeout)
+            timeout=timeout,
+            layout=layout)
+        self.rcvbuf = rcvbuf
 
     def start(self):
+        rcvbuf = self.rcvbuf
+        if rcvbuf is None:
+            rcvbuf = max(4 * 1024 * 1024, 8 * self._lenmsg)
+
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # The receive buffer size must be set before connecting for the TCP
+        # window to be scaled accordingly.
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.socket.connect((self.ip, self.port))
         self.socket.settimeout(self.timeout)
+        # With MSG_WAITALL the kernel waits for a whole packet, so a read is
+        # normally a single recv call. Sockets with a timeout are
+        # non-blocking internally, where the flag is not supported everywhere.
+        if self.timeout is None:
+            self._recv_flags = getattr(socket, 'MSG_WAITALL', 0)
+        else:
+            self._recv_flags = 0
 
     def read(self):
         """
@@ -104,23 +253,22 @@ class TCPSocketReader(_SocketReader):
         -------
         data : ndarray, shape=(array_len, samples_per_read)
             Data read from the device. Each channel is a row and each column
-            is a point in time.
+            is a point in time. With the ``'view'`` layout, the array is
+            reused and overwritten by the next call to ``read()``.
         """
         lenp = 0
-        packets = bytes()
         try:
             while lenp < self._lenmsg:
-                rec_data = self.socket.recv(self._lenmsg - lenp)
-                packets += rec_data
-                lenp = len(packets)
+                n_bytes = self.socket.recv_into(
+                    self._view[lenp:], 0, self._recv_flags)
+                if n_bytes == 0:
+                    # Connection closed by the peer
+                    raise IOError()
+                lenp += n_bytes
         except socket.timeout:
             raise IOError()
 
-        data = np.asarray(
-            struct.unpack(self._fmt, packets))
-        data = np.transpose(data.reshape((-1, self.array_len)))
-
-        return data
+        return self._unpack()
 
 
 class UDPSocketReader(_SocketReader):
@@ -141,6 +289,18 @@ class UDPSocketReader(_SocketReader):
         Floating point precision. Default if 'single'.
     timeout : float, optional
         Socket timeout time. Default is None.
+    layout : str {'channel_major', 'view'}
+        Memory layout of the data returned by ``read()``. ``'channel_major'``
+        copies it into a new C-contiguous array. ``'view'`` returns a strided
+        view of the receive buffer without copying, which is cheaper when the
+        data are only reduced per channel (e.g. mean or RMS), but is
+        overwritten by the next call to ``read()``. Default is
+        'channel_major'.
+    datagram_size : int, optional
+        Size in bytes of each datagram sent by the streaming application. If
+        provided, on Linux all datagrams making up a read are received with as
+        few ``recvmmsg`` calls as possible. Must divide the number of bytes in
+        a read. Default is None.
     """
     def __init__(
             self,
@@ -149,20 +309,37 @@ class UDPSocketReader(_SocketReader):
             array_len,
             samples_per_read,
             precision='single',
-            timeout=None):
+            timeout=None,
+            layout='channel_major',
+            datagram_size=None):
         super(UDPSocketReader, self).__init__(
             ip=ip,
             port=port,
             array_len=array_len,
             samples_per_read=samples_per_read,
             precision=precision,
-            timeout=timeout)
+            timeout=timeout,
+            layout=layout)
+        self.datagram_size = datagram_size
+
+        if self.datagram_size is not None and \
+                self._lenmsg % self.datagram_size != 0:
+            raise ValueError(
+                "Datagram size must divide the {} bytes of a read, but "
+                "``{}`` was provided.".format(
+                    self._lenmsg, self.datagram_size))
 
     def start(self):
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.bind((self.ip, self.port))
         self.socket.settimeout(self.timeout)
 
+        if self.datagram_size is not None and _recvmmsg is not None:
+            self._receiver = _DatagramReceiver(
+                self._buffer, self.datagram_size)
+        else:
+            self._receiver = None
+
     def read(self):
         """
         Request a sample of data from the device.
@@ -174,20 +351,18 @@ class UDPSocketReader(_SocketReader):
         -------
         data : ndarray, shape=(array_len, samples_per_read)
             Data read from the device. Each channel is a row and each column
-            is a point in time.
+            is a point in time. With the ``'view'`` layout, the array is
+            reused and overwritten by the next call to ``read()``.
         """
         lenp = 0
-        packets = bytes()
         try:
-            while lenp < self._lenmsg:
-                rec_data, _ = self.socket.recvfrom(self._lenmsg - lenp)
-                packets += rec_data
-                lenp = len(packets)
+            if self._receiver is not None:
+                self._receiver.receive(self.socket)
+            else:
+                while lenp < self._lenmsg:
+                    n_bytes, _ = self.socket.recvfrom_into(self._view[lenp:])
+                    lenp += n_bytes
         except socket.timeout:
             raise IOError()
 
-        data = np.asarray(
-            struct.unpack(self._fmt, packets))
-        data = np.transpose(data.reshape((-1, self.array_len)))
-
-        return data
+        return self._unpack()
@@ -1,90 +1,268 @@
 from axopy.gui.main import get_qtapp
 import numpy as np
+from threading import Thread
 import time
 
 from PyQt5 import QtCore
-import pygame
 
-import queue
+from .base import _RingBuffer
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _divide_axes(xy, out):
+    """Split two axes into [x-, x+, y-, y+], each half clipped at zero."""
+    for i in range(2):
+        out[2 * i] = max(-xy[i], 0.0)
+        out[2 * i + 1] = max(xy[i], 0.0)
+
+
+# Compiled when Numba is available, which removes the interpreter overhead
+# of the per-sample split. Otherwise the plain Python version is used.
+if njit is not None:
+    _divide_axes = njit(cache=True)(_divide_axes)
+
 
 class _Sleeper(object):
+    """
+    Paces calls to a fixed period.
+
+    Deadlines are advanced by ``read_time`` from the previous deadline rather
+    than from the time of the call, so that timing errors do not accumulate.
+    ``time.sleep`` is only used for the bulk of the wait, as it can overshoot
+    by several ms on some platforms; the last ``spin_time`` seconds, or
+    ``spin_fraction`` of the period if that is shorter, are busy-waited.
+    """
+
+    spin_time = 1e-3
+    spin_fraction = 0.1
 
     def __init__(self, read_time):
         self.read_time = read_time
-        self.last_read_time = None
+        self._deadline = None
 
     def sleep(self):
-        t = time.time()
-        if self.last_read_time is None:
-            time.sleep(self.read_time)
+        now = time.perf_counter()
+        if self._deadline is None:
+            self._deadline = now + self.read_time
         else:
-            try:
-                time.sleep(self.read_time - (t - self.last_read_time))
-            except ValueError:
-                # if we're not meeting real-time requirement, don't wait
-                pass
+            self._deadline += self.read_time
+            if self._deadline < now:
+                # if we're not meeting real-time requirement, don't wait and
+                # don't try to catch up either
+                self._deadline = now
 
-        self.last_read_time = time.time()
+        # The thread runs for as long as the device is started, so only a
+        # small part of each period is spent spinning.
+        spin_time = min(self.spin_time, self.spin_fraction * self.read_time)
+        remaining = self._deadline - now
+        if remaining > spin_time:
+            time.sleep(remaining - spin_time)
+        while time.perf_counter() < self._deadline:
+            # release the GIL while spinning
+            time.sleep(0)
 
     def reset(self):
-        self.last_read_time = None
+        self._deadline = None
+
+
+class _PygameJoystick(object):
+    """Joystick state read through pygame."""
+
+    def __init__(self, dev_id):
+        import pygame
+
+        self._pygame = pygame
+        self.dev_id = dev_id
+
+        pygame.display.init()
+        pygame.joystick.init()
+
+    def open(self):
+        self._joystick = self._pygame.joystick.Joystick(self.dev_id)
+        self._joystick.init()
+        self.num_axes = self._joystick.get_numaxes()
+        self.num_buttons = self._joystick.get_numbuttons()
+
+    def poll(self, axes, buttons):
+        """Fill ``axes`` and ``buttons`` with the current joystick state."""
+        self._pygame.event.pump()
+        get_axis = self._joystick.get_axis
+        get_button = self._joystick.get_button
+        axes[:] = [get_axis(i) for i in range(len(axes))]
+        buttons[:] = [get_button(i) for i in range(len(buttons))]
+        self._pygame.event.clear(pump=True)
+
+    def close(self):
+        pass
+
+
+class _SDLJoystick(object):
+    """
+    Joystick state read directly through SDL2 (PySDL2).
+
+    Joystick events are disabled and the state is updated explicitly, so
+    reading does not go through the SDL event queue at all.
+    """
+
+    def __init__(self, dev_id):
+        import sdl2
+
+        self._sdl2 = sdl2
+        self.dev_id = dev_id
+
+        if sdl2.SDL_InitSubSystem(sdl2.SDL_INIT_JOYSTICK) != 0:
+            raise RuntimeError(sdl2.SDL_GetError().decode())
+        sdl2.SDL_JoystickEventState(sdl2.SDL_IGNORE)
+
+    def open(self):
+        self._joystick = self._sdl2.SDL_JoystickOpen(self.dev_id)
+        if not self._joystick:
+            raise RuntimeError(self._sdl2.SDL_GetError().decode())
+        self.num_axes = self._sdl2.SDL_JoystickNumAxes(self._joystick)
+        self.num_buttons = self._sdl2.SDL_JoystickNumButtons(self._joystick)
+
+    def poll(self, axes, buttons):
+        """Fill ``axes`` and ``buttons`` with the current joystick state."""
+        self._sdl2.SDL_JoystickUpdate()
+        joystick = self._joystick
+        get_axis = self._sdl2.SDL_JoystickGetAxis
+        get_button = self._sdl2.SDL_JoystickGetButton
+        axes[:] = [get_axis(joystick, i) for i in range(len(axes))]
+        # same scaling to [-1, 1] as pygame
+        axes /= 32768.0
+        buttons[:] = [get_button(joystick, i) for i in range(len(buttons))]
+
+    def close(self):
+        self._sdl2.SDL_JoystickClose(self._joystick)
 
 
 class Stick(QtCore.QObject):
-    def __init__(self, rate = 1000, dev_id = 0, mode = 'full'):
+    """
+    Joystick / gamepad reader device.
+
+    Parameters
+    ----------
+    rate : float, optional
+        Rate at which the joystick is polled. Default is 1000.
+    dev_id : int, optional
+        Joystick device index. Default is 0.
+    mode : str {'full', 'divaxis'}, optional
+        ``'full'`` returns all axes followed by all buttons. ``'divaxis'``
+        returns the first two axes, each split into its negative and positive
+        halves. Default is ``'full'``.
+    backend : str {'pygame', 'sdl2'}, optional
+        Library used to read the joystick. ``'sdl2'`` requires PySDL2 and
+        skips pygame's event queue handling. Default is ``'pygame'``.
+
+    The joystick is sampled at ``rate`` by a background thread, independently
+    of how often ``read()`` is called. Only the latest sample is kept, so
+    reads slower than ``rate`` always get the current joystick state.
+    """
+
+    def __init__(self, rate = 1000, dev_id = 0, mode = 'full',
+                 backend = 'pygame'):
         super(Stick, self).__init__()
-        self.data_queue = queue.Queue()
         self.rate = rate
         self.dev_id = dev_id
         self.mode = mode
+        self.backend = backend
 
-        pygame.display.init()
-        pygame.joystick.init()
+        if self.mode not in ('full', 'divaxis'):
+            raise ValueError(
+                "Mode must be either ``full`` or ``divaxis``, but "
+                "``{}`` was provided.".format(self.mode))
+
+        if self.backend == 'pygame':
+            self._joystick = _PygameJoystick(dev_id)
+        elif self.backend == 'sdl2':
+            self._joystick = _SDLJoystick(dev_id)
+        else:
+            raise ValueError(
+                "Backend must be either ``pygame`` or ``sdl2``, but "
+                "``{}`` was provided.".format(self.backend))
 
         self._sleeper = _Sleeper(1.0 / rate)
 
     def start(self):
-        self.controller = pygame.joystick.Joystick(self.dev_id)
-        self.controller.init()
+        self._joystick.open()
         get_qtapp().installEventFilter(self)
-        self._dataPre = np.zeros([self.controller.get_numaxes() + self.controller.get_numbuttons(), 1])
+        self._na = self._joystick.num_axes
+        self._nb = self._joystick.num_buttons
+        self._state = np.empty(self._na + self._nb)
+        self._divided = np.empty(4)
+        n_channels = self._na + self._nb if self.mode == 'full' else 4
+        # Holds a single sample, which is replaced by each new one, so that
+        # no backlog builds up when reads are slower than the polling rate.
+        self._ring = _RingBuffer(n_channels, 1, dtype=np.float64,
+                                 overwrite=True)
 
-    def read(self):
-        self._sleeper.sleep()
-        pygame.event.pump()
-        for i in range(0, self.controller.get_numaxes()):
-            self._dataPre[i] = self.controller.get_axis(i)
-        for i in range(0, self.controller.get_numbuttons()):
-            self._dataPre[i+self.controller.get_numaxes()] = self.controller.get_button(i)
+        if self.mode == 'divaxis':
+            # triggers Numba compilation before sampling starts
+            _divide_axes(self._state, self._divided)
+
+        self._sleeper.reset()
+        self._error = None
+        self._flag = True
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while self._flag:
+                self._sleeper.sleep()
+                self._sample()
+        except Exception as e:
+            # e.g. the joystick has been unplugged; raised again by read()
+            self._error = e
+        finally:
+            # wakes up a blocked read()
+            self._ring.close()
+
+    def _sample(self):
+        na = self._na
+        state = self._state
+        self._joystick.poll(state[:na], state[na:])
         if(self.mode == 'full'):
-            self._data = self._dataPre
+            self._ring.write(state)
         elif(self.mode == 'divaxis'):
-            self._data = np.zeros([4, 1])
-
             # to be analogues with EMG, we split the axis into two (left/right and up/down)
-            if self._dataPre[0] <= 0:
-                self._data[0] = abs(self._dataPre[0])
-                self._data[1] = 0
-            else:
-                self._data[0] = 0
-                self._data[1] = abs((self._dataPre[0]))
-
-            if self._dataPre[1] <= 0:
-                self._data[2] = abs(self._dataPre[1])
-                self._data[3] = 0
-            else:
-                self._data[2] = 0
-                self._data[3] = abs((self._dataPre[1]))
-
-        pygame.event.clear(pump=True)
-        out = self._data.copy()
-        self._data *= 0
-        self._dataPre *= 0
-        return out
+            # giving [left, right, up, down], each half clipped at zero
+            _divide_axes(state, self._divided)
+            self._ring.write(self._divided)
+
+    def read(self):
+        """
+        Request a sample of data from the device.
+
+        This is a blocking method, meaning it returns only once a sample that
+        has not been read yet is available.
+
+        Returns
+        -------
+        data : ndarray, shape=(n_channels, 1)
+            Latest sample, if not read yet.
+
+        Raises
+        ------
+        IOError
+            If the joystick could not be polled, or sampling has stopped.
+        """
+        data = self._ring.read(1)
+        if data is None:
+            if self._error is not None:
+                raise IOError("Joystick could not be read.") from self._error
+            raise IOError("Joystick is not streaming.")
+        return data
 
     def stop(self):
+        self._flag = False
+        self._thread.join()
         get_qtapp().removeEventFilter(self)
+        self._joystick.close()
 
     def reset(self):
-        self._sleeper.reset()
-        self.data_queue.queue.clear()
\ No newline at end of file
+        self._ring.clear()